@@ -58,6 +58,5 @@ if __name__ == '__main__':
         else:
             upload_url = f'{URL}/artifacts/{BUCKET}/upload'
             requests.post(f'{URL}/artifacts/bucket', allow_redirects=True, data={'bucket': BUCKET}, headers=headers)
-        files = {'file': open(path_to_test_results + ".zip", 'rb')}
-
-        requests.post(upload_url, allow_redirects=True, files=files, headers=headers)
\ No newline at end of file
+        with open(path_to_test_results + ".zip", 'rb') as f:
+            requests.post(upload_url, allow_redirects=True, files={'file': f}, headers=headers)
\ No newline at end of file
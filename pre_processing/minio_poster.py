@@ -27,12 +27,12 @@ try:
     ziph = zipfile.ZipFile(PATH_TO_FILE, 'w', zipfile.ZIP_DEFLATED)
     zipdir(ziph)
     ziph.close()
-    files = {'file': open(PATH_TO_FILE,'rb')}
     headers = {'Authorization': f'bearer {TOKEN}'} if TOKEN else {}
     if PROJECT_ID:
         upload_url = f'{URL}/api/v1/artifacts/{PROJECT_ID}/{BUCKET}/file'
     else:
         upload_url = f'{URL}/artifacts/{BUCKET}/upload'
-    r = requests.post(upload_url, allow_redirects=True, files=files, headers=headers)
+    with open(PATH_TO_FILE, 'rb') as f:
+        r = requests.post(upload_url, allow_redirects=True, files={'file': f}, headers=headers)
 except Exception:
     print(format_exc())